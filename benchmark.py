@@ -0,0 +1,895 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for the Personal Website Creator
+This script times the extraction and parsing paths on generated documents.
+"""
+
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import platform
+import random
+import re
+import resource
+import tempfile
+import sys
+import time
+import tracemalloc
+import zipfile
+
+from docx import Document
+
+from app import (SITE_TEMPLATES, SKILL_ALIASES, FileParser, ParseCache, ResumeData, ResumeParser,
+                 VectorHeaderClassifier, WebsiteGenerator, np)
+
+def build_sample_pdf(page_count, lines_per_page=60):
+    """Build a text-only PDF with dense pages and return its bytes"""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in once the page ids are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+    for page_number in range(page_count):
+        lines = [
+            f"({page_number + 1}.{line + 1} Led delivery of resume parsing pipeline, improved throughput by {line}%) Tj T*"
+            for line in range(lines_per_page)
+        ]
+        stream = ("BT /F1 9 Tf 11 TL 40 770 Td\n" + "\n".join(lines) + "\nET").encode('latin-1')
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        page_ids.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, page_count)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    return bytes(out)
+
+def build_sample_docx(paragraph_count, table_rows=0):
+    """Build a DOCX with the given number of paragraphs plus an optional table and return its bytes
+
+    python-docx slows down quadratically when appending this many
+    paragraphs, so only the package skeleton comes from it and
+    word/document.xml is written directly.
+    """
+    skeleton = io.BytesIO()
+    Document().save(skeleton)
+    body = [
+        f'<w:p><w:r><w:t>• Delivered project {i} on time, cutting processing cost by {i % 90}% across teams</w:t></w:r></w:p>'
+        for i in range(paragraph_count)
+    ]
+    if table_rows:
+        body.append('<w:tbl>')
+        for i in range(table_rows):
+            body.append(
+                f'<w:tr><w:tc><w:p><w:r><w:t>Skill {i}</w:t></w:r></w:p></w:tc>'
+                f'<w:tc><w:p><w:r><w:t>Used daily for {i % 12} years</w:t></w:r></w:p></w:tc></w:tr>'
+            )
+        body.append('</w:tbl>')
+    document_xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+        + ''.join(body) + '</w:body></w:document>'
+    )
+    out = io.BytesIO()
+    with zipfile.ZipFile(skeleton) as source, zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED) as target:
+        for item in source.infolist():
+            data = document_xml.encode('utf-8') if item.filename == 'word/document.xml' else source.read(item)
+            target.writestr(item.filename, data)
+    return out.getvalue()
+
+def _rss_kb(field):
+    """Read a memory counter in KB from /proc/self/status"""
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith(field + ':'):
+                return int(line.split()[1])
+    raise KeyError(field)
+
+def _measure_in_child(func, args, results):
+    """Run func(*args) and report its duration and how far it pushed peak RSS, in KB"""
+    try:
+        # Reset the high-water mark so import-time peaks do not hide ours (Linux only)
+        with open('/proc/self/clear_refs', 'w') as clear_refs:
+            clear_refs.write('5')
+        rss_before = _rss_kb('VmRSS')
+        peak = lambda: _rss_kb('VmHWM')
+    except OSError:
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak = lambda: resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    results.put((elapsed, peak() - rss_before))
+
+def measure_peak_rss(func, *args):
+    """Run func in a fresh process so its peak RSS is not hidden by earlier work"""
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    process = context.Process(target=_measure_in_child, args=(func, args, results))
+    process.start()
+    outcome = results.get()
+    process.join()
+    return outcome
+
+def time_call(func, *args, repeat=3, **kwargs):
+    """Return the best wall-clock time of several calls"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def benchmark_pdf_extraction(workers):
+    """Compare serial, page-parallel and probe-selected PDF extraction"""
+    print("📄 Benchmark: PDF extraction (serial vs page-parallel vs auto engine)")
+    print("=" * 60)
+
+    print(f"Parallel mode uses up to {workers} worker(s)")
+    print(f"{'pages':>6} {'serial':>10} {'parallel':>10} {'speedup':>8} {'auto':>10}  engine")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for page_count in (1, 10, 100):
+            path = os.path.join(tmp_dir, f'resume_{page_count}.pdf')
+            with open(path, 'wb') as f:
+                f.write(build_sample_pdf(page_count))
+
+            serial_text = FileParser.extract_text_from_pdf(path, engine='pdfplumber')
+            parallel_text = FileParser.extract_text_from_pdf(path, workers, engine='pdfplumber')
+            assert serial_text == parallel_text, "parallel extraction changed the output"
+
+            repeat = 1 if page_count >= 100 else 3
+            serial = time_call(FileParser.extract_text_from_pdf, path, engine='pdfplumber', repeat=repeat)
+            parallel = time_call(FileParser.extract_text_from_pdf, path, workers, engine='pdfplumber', repeat=repeat)
+            stats = {}
+            FileParser.extract_text_from_pdf(path, workers, stats=stats)
+            auto = time_call(FileParser.extract_text_from_pdf, path, workers, repeat=repeat)
+            print(f"{page_count:>6} {serial * 1000:>8.1f}ms {parallel * 1000:>8.1f}ms {serial / parallel:>7.2f}x {auto * 1000:>8.1f}ms  {stats['engine']}")
+    print()
+
+def benchmark_pdf_memory():
+    """Report peak PDF extraction memory as the page count grows
+
+    tests/test_pdf_memory.py asserts that it stays flat; this prints the numbers.
+    """
+    print("🧠 Benchmark: PDF extraction peak memory (tracemalloc)")
+    print("=" * 60)
+    print(f"{'pages':>6} {'peak':>10} {'text':>10} {'overhead':>10}")
+
+    for page_count in (5, 20, 40):
+        data = build_sample_pdf(page_count, lines_per_page=30)
+        tracemalloc.start()
+        text = FileParser.extract_text_from_pdf(data, engine='pdfplumber')
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        # The extracted text itself has to grow with the page count; everything else should not
+        overhead = peak - sys.getsizeof(text)
+        print(f"{page_count:>6} {peak / 1024:>8.0f}KB {sys.getsizeof(text) / 1024:>8.0f}KB {overhead / 1024:>8.0f}KB")
+
+    print()
+
+def benchmark_docx_extraction():
+    """Compare streaming DOCX extraction with the python-docx object model"""
+    print("📝 Benchmark: DOCX extraction (python-docx vs streaming)")
+    print("=" * 60)
+    print(f"{'paragraphs':>10} {'python-docx':>14} {'rss':>9} {'streaming':>12} {'rss':>9}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for paragraph_count in (1000, 10000, 50000):
+            path = os.path.join(tmp_dir, f'resume_{paragraph_count}.docx')
+            with open(path, 'wb') as f:
+                f.write(build_sample_docx(paragraph_count, table_rows=paragraph_count // 10))
+
+            legacy_time, legacy_rss = measure_peak_rss(FileParser._extract_docx_python_docx, path)
+            stream_time, stream_rss = measure_peak_rss(FileParser.extract_text_from_docx, path)
+            print(f"{paragraph_count:>10} {legacy_time * 1000:>12.1f}ms {legacy_rss / 1024:>7.1f}MB "
+                  f"{stream_time * 1000:>10.1f}ms {stream_rss / 1024:>7.1f}MB")
+    print()
+
+def _extract_then_parse(path, file_ext):
+    return ResumeParser().parse_resume(FileParser.extract_text(path, file_ext))
+
+def _stream_parse(path, file_ext):
+    return ResumeParser().parse_resume_lines(FileParser.iter_text_lines(path, file_ext))
+
+def benchmark_streaming_parse():
+    """Compare extract-then-parse with parsing lines as the extractor yields them"""
+    print("🌊 Benchmark: extract then parse vs streaming line parser")
+    print("=" * 60)
+    print(f"{'document':>16} {'extract+parse':>14} {'rss':>9} {'streaming':>12} {'rss':>9}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        documents = (
+            ('pdf', 50, build_sample_pdf(50)),
+            ('pdf', 200, build_sample_pdf(200)),
+            ('docx', 10000, build_sample_docx(10000, table_rows=1000)),
+            ('docx', 50000, build_sample_docx(50000, table_rows=5000)),
+        )
+        for file_ext, size, content in documents:
+            path = os.path.join(tmp_dir, f'resume_{size}.{file_ext}')
+            with open(path, 'wb') as f:
+                f.write(content)
+            if size <= 10000:
+                assert _stream_parse(path, file_ext) == _extract_then_parse(path, file_ext), f"{path}: results differ"
+
+            joined_time, joined_rss = measure_peak_rss(_extract_then_parse, path, file_ext)
+            stream_time, stream_rss = measure_peak_rss(_stream_parse, path, file_ext)
+            label = f"{size} {'pages' if file_ext == 'pdf' else 'paragraphs'}"
+            print(f"{label:>16} {joined_time * 1000:>12.1f}ms {joined_rss / 1024:>7.1f}MB "
+                  f"{stream_time * 1000:>10.1f}ms {stream_rss / 1024:>7.1f}MB")
+    print()
+
+def build_resume_text(line_count):
+    """Repeat the sample resume until it has line_count lines"""
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sample_resume.txt'), encoding='utf-8') as f:
+        sample = f.read().split('\n')
+    return '\n'.join(sample[i % len(sample)] for i in range(line_count))
+
+def _legacy_contact_scan(resume_text):
+    """The per-line contact search ResumeParser used before the single-pass scanner"""
+    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+    phone_pattern = r'[\+]?[1-9]?[\d\-\(\)\s]{10,}'
+    linkedin_pattern = r'linkedin\.com/in/[\w\-]+'
+    github_pattern = r'github\.com/[\w\-]+'
+    data = {}
+    for i, line in enumerate(resume_text.split('\n')):
+        line = line.strip()
+        if not line:
+            continue
+        if i < 3 and not re.search(email_pattern, line) and not re.search(phone_pattern, line):
+            continue
+        for field, pattern in (('email', email_pattern), ('phone', phone_pattern),
+                               ('linkedin', linkedin_pattern), ('github', github_pattern)):
+            match = re.search(pattern, line)
+            if match:
+                data[field] = match.group()
+    return data
+
+def benchmark_contact_scan():
+    """Compare the single-pass contact scanner with the old per-line searches"""
+    print("📇 Benchmark: contact extraction (per-line searches vs single pass)")
+    print("=" * 60)
+    print("'complete' has every field in the header; 'no github' forces a scan of the whole text")
+    print(f"{'lines':>7} {'case':>10} {'per-line':>12} {'single-pass':>12} {'speedup':>8}")
+
+    for line_count in (50, 500, 5000, 50000):
+        complete = build_resume_text(line_count)
+        cases = (('complete', complete), ('no github', complete.replace('github.com/', 'github: ')))
+        for case, text in cases:
+            repeat = 3 if line_count >= 50000 else 20
+            legacy = time_call(_legacy_contact_scan, text, repeat=repeat)
+            single = time_call(ResumeParser.extract_contacts, text, repeat=repeat)
+            print(f"{line_count:>7} {case:>10} {legacy * 1000:>10.2f}ms {single * 1000:>10.2f}ms {legacy / single:>7.1f}x")
+    print()
+
+def _legacy_skill_dedup(lines):
+    """The list-membership de-duplication _parse_skills used before the ordered set"""
+    skills = []
+    for line in lines:
+        for skill in re.split(r'[,•\-\n]', line):
+            skill = skill.strip()
+            if skill and skill not in skills:
+                skills.append(skill)
+    return skills
+
+def benchmark_skill_accumulation():
+    """Compare list de-duplication with the ordered-set skill accumulator"""
+    print("🧰 Benchmark: skill accumulation (list membership vs ordered set)")
+    print("=" * 60)
+    print(f"{'skills':>7} {'list':>12} {'ordered set':>12} {'speedup':>8}")
+    for skill_count in (100, 1000, 5000, 20000):
+        lines = [', '.join(f'Skill{i + j}' for j in range(10)) for i in range(0, skill_count, 10)]
+        repeat = 1 if skill_count >= 20000 else 5
+        legacy = time_call(_legacy_skill_dedup, lines, repeat=repeat)
+        ordered = time_call(lambda: ResumeParser._parse_skills(ResumeData(skills={}), lines), repeat=repeat)
+        print(f"{skill_count:>7} {legacy * 1000:>10.2f}ms {ordered * 1000:>10.2f}ms {legacy / ordered:>7.1f}x")
+    print()
+
+def benchmark_batch_parsing(workers, document_count=2000):
+    """Compare a parse_resume_text loop with ResumeParser.parse_many"""
+    print(f"📚 Benchmark: batch parsing of {document_count} resumes (loop vs parse_many)")
+    print("=" * 60)
+    texts = [build_resume_text(60 + i % 40) for i in range(document_count)]
+    resume_parser = ResumeParser()
+
+    loop = time_call(lambda: [resume_parser.parse_resume_text(text) for text in texts], repeat=1)
+    print(f"{'loop':>22}: {loop * 1000:>9.1f}ms")
+    for worker_count in sorted({1, workers}):
+        for chunksize in (1, 16, 64):
+            results = []
+            elapsed = time_call(lambda: results.append(list(resume_parser.parse_many(texts, worker_count, chunksize))), repeat=1)
+            assert all(result['success'] for result in results[-1])
+            label = f"{worker_count} worker(s), chunk {chunksize}"
+            print(f"{label:>22}: {elapsed * 1000:>9.1f}ms  {loop / elapsed:>5.2f}x")
+    print(f"({os.cpu_count()} CPU(s) available)")
+    print()
+
+def benchmark_parse_memo():
+    """Compare a fresh parse with a ParseCache hit on the same, re-indented text"""
+    print("🧠 Benchmark: parse memo (parse vs cache hit)")
+    print("=" * 60)
+    print(f"{'lines':>7} {'parse':>12} {'cache hit':>12} {'speedup':>8}")
+    resume_parser = ResumeParser()
+    for line_count in (60, 600, 6000):
+        text = build_resume_text(line_count)
+        tweaked = text.replace('\n', '  \r\n')  # what a paste from another editor looks like
+        cache = ParseCache(64 * 1024 * 1024, resume_parser)
+        cache.parse_resume_text(text)
+        parse = time_call(resume_parser.parse_resume_text, text, repeat=5)
+        hit = time_call(cache.parse_resume_text, tweaked, repeat=5)
+        print(f"{line_count:>7} {parse * 1000:>10.2f}ms {hit * 1000:>10.2f}ms {parse / hit:>7.1f}x")
+        assert cache.stats()['misses'] == 1, "re-indented text should hit the memo"
+    print()
+
+# Vocabulary for generate_resume
+FIRST_NAMES = ['Sarah', 'Michael', 'Priya', 'Diego', 'Aisha', 'Chen', 'Olga', 'Kwame', 'Emma', 'Lucas', 'Yuki', 'Fatima']
+LAST_NAMES = ['Chen', 'Johnson', 'Patel', 'Garcia', 'Okafor', 'Wang', 'Ivanova', 'Mensah', 'Smith', 'Silva', 'Tanaka', 'Haddad']
+JOB_TITLES = ['Software Engineer', 'Senior Frontend Developer', 'Data Scientist', 'Product Manager', 'DevOps Engineer',
+              'Full Stack Developer', 'UX Designer', 'Backend Engineer', 'QA Analyst', 'Engineering Manager']
+COMPANIES = ['TechFlow Solutions', 'StartupLab Inc.', 'WebCraft Agency', 'Globex Corporation', 'Initech',
+             'Umbrella Analytics', 'Stark Industries', 'Hooli', 'Acme Cloud', 'Northwind Traders']
+SCHOOLS = ['University of California, Berkeley', 'MIT', 'University of Toronto', 'ETH Zurich',
+           'Georgia Institute of Technology', 'National University of Singapore']
+DEGREES = ['Bachelor of Science in Computer Science', 'Master of Science in Data Science', 'B.A. in Economics',
+           'Bachelor of Engineering, Software Engineering', 'MBA']
+BULLET_VERBS = ['Led', 'Built', 'Designed', 'Implemented', 'Optimized', 'Migrated', 'Mentored', 'Automated', 'Launched']
+BULLET_OBJECTS = ['the checkout service', 'a real-time analytics pipeline', 'our onboarding flow', 'the design system',
+                  'CI/CD for 40 microservices', 'a recommendation engine', 'the billing platform', 'internal tooling']
+BULLET_RESULTS = ['reducing latency by {n}%', 'serving {n}K+ daily users', 'cutting costs by {n}%',
+                  'improving conversion by {n}%', 'with {n}% test coverage', 'across {n} teams']
+BULLET_GLYPHS = ['•', '-', '*', '●', '▪', '\uf0b7']
+SECTION_TITLES = {
+    'summary': ['Summary', 'Professional Summary', 'Profile', 'Objective', 'About Me'],
+    'experience': ['Experience', 'Professional Experience', 'Work History', 'Employment', 'Work Experience'],
+    'education': ['Education', 'Academic Background', 'Education and Training'],
+    'skills': ['Skills', 'Technical Skills', 'Core Competencies', 'Skills & Tools', 'Technologies'],
+    'projects': ['Projects', 'Personal Projects', 'Side Projects'],
+    'other': ['Certifications', 'Awards', 'Languages', 'Interests', 'Volunteering'],
+}
+# Generated resume sizes: jobs, bullets per job, projects
+CORPUS_SIZES = {
+    'small': (2, 3, 1),
+    'medium': (4, 5, 3),
+    'large': (25, 8, 20),
+}
+
+def generate_resume(rng, jobs=4, bullets=5, projects=3, noise=0.3):
+    """Generate one realistic resume text and the section of each of its header lines
+
+    Returns (text, labels) where labels maps line numbers to the section
+    each header line opens. Headers vary in wording and style (upper case,
+    trailing colons, inline content); with probability noise the text also
+    picks up the artifacts PDF extraction leaves behind: running headers,
+    page footers, form feeds, ligatures, hyphenated breaks and ragged
+    whitespace.
+    """
+    lines = []
+    labels = {}
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    handle = name.lower().replace(' ', '')
+
+    def header(section):
+        title = rng.choice(SECTION_TITLES[section])
+        style = rng.random()
+        if style < 0.3:
+            title = title.upper()
+        elif style < 0.5:
+            title += ':'
+        labels[len(lines)] = section
+        lines.append(title)
+
+    def bullet():
+        result = rng.choice(BULLET_RESULTS).format(n=rng.randint(5, 95))
+        return f"{rng.choice(BULLET_GLYPHS)} {rng.choice(BULLET_VERBS)} {rng.choice(BULLET_OBJECTS)}, {result}"
+
+    lines.append(name)
+    lines.append(rng.choice(JOB_TITLES))
+    contacts = [f"{handle}@{rng.choice(['email.com', 'mail.io', 'company.co.uk'])}",
+                f"({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+                f"linkedin.com/in/{handle}"]
+    if rng.random() < 0.5:
+        contacts.append(f"github.com/{handle}")
+    if rng.random() < 0.3:
+        contacts.append(f"{handle}.dev")
+    rng.shuffle(contacts)
+    if rng.random() < 0.5:
+        lines.append(' | '.join(contacts))
+    else:
+        lines.extend(contacts)
+    lines.append('')
+
+    sections = ['summary', 'experience', 'education', 'skills', 'projects', 'other']
+    rng.shuffle(sections[2:])
+    for section in sections:
+        if section == 'summary':
+            header(section)
+            lines.append(f"{rng.choice(JOB_TITLES)} with {rng.randint(2, 15)}+ years of experience building "
+                         f"products; strong skills in {', '.join(rng.sample(list(SKILL_ALIASES), 3))}.")
+        elif section == 'experience':
+            header(section)
+            year = 2024
+            for _ in range(jobs):
+                start = year - rng.randint(1, 4)
+                lines.append(f"{rng.choice(JOB_TITLES)} - {rng.choice(COMPANIES)} ({start}-{year})")
+                lines.extend(bullet() for _ in range(bullets))
+                lines.append('')
+                year = start
+        elif section == 'education':
+            header(section)
+            lines.append(rng.choice(DEGREES))
+            lines.append(f"{rng.choice(SCHOOLS)} ({rng.randint(2000, 2016)})")
+            lines.append('')
+        elif section == 'skills':
+            skills = [rng.choice([canonical, *aliases]) for canonical, aliases in rng.sample(list(SKILL_ALIASES.items()), 12)]
+            if rng.random() < 0.3:
+                # Inline content after the header
+                labels[len(lines)] = section
+                lines.append(f"{rng.choice(SECTION_TITLES[section])}: {', '.join(skills)}")
+            else:
+                header(section)
+                for i in range(0, len(skills), 4):
+                    lines.append(f"{rng.choice(['Frontend', 'Backend', 'Frameworks', 'Databases', 'Cloud & DevOps'])}: {', '.join(skills[i:i + 4])}")
+            lines.append('')
+        elif section == 'projects':
+            header(section)
+            for i in range(projects):
+                lines.append(f"Project {rng.choice(BULLET_OBJECTS).title()} ({rng.randint(2015, 2024)})")
+                lines.extend(bullet() for _ in range(2))
+            lines.append('')
+        else:
+            header(section)
+            lines.append(f"{rng.choice(['AWS Certified Developer', 'Fluent in Spanish', 'Hackathon winner', 'Marathon runner'])}")
+            lines.append('')
+
+    if rng.random() < noise:
+        lines, labels = _add_pdf_noise(rng, lines, labels, name)
+    return '\n'.join(lines), labels
+
+def _add_pdf_noise(rng, lines, labels, name):
+    """Sprinkle PDF extraction artifacts over lines, keeping labels pointed at the right lines"""
+    noisy = []
+    noisy_labels = {}
+    page_lines = rng.randint(30, 50)
+    page_count = len(lines) // page_lines + 1
+    for i, line in enumerate(lines):
+        if i and i % page_lines == 0:
+            page = i // page_lines
+            noisy.append(f"Page {page} of {page_count}")
+            noisy.append('\x0c' + f"{name} - Resume")
+        if i in labels:
+            noisy_labels[len(noisy)] = labels[i]
+        elif line and rng.random() < 0.1:
+            line = line.replace('fi', '\ufb01').replace('fl', '\ufb02')
+        elif len(line) > 40 and rng.random() < 0.1:
+            # A long word hyphenated across a line break
+            words = line.split(' ')
+            long_words = [k for k, word in enumerate(words) if k and len(word) >= 6]
+            if long_words:
+                k = rng.choice(long_words)
+                half = len(words[k]) // 2
+                noisy.append(' '.join(words[:k] + [words[k][:half] + '-']))
+                line = ' '.join([words[k][half:]] + words[k + 1:])
+        if rng.random() < 0.2:
+            line = line.replace(' ', '  ', 1) + rng.choice([' ', '\t', '  '])
+        noisy.append(line)
+    return noisy, noisy_labels
+
+def generate_resume_corpus(count, seed=0, size='medium', noise=0.3):
+    """Generate count (text, labels) resumes deterministically from seed"""
+    rng = random.Random(seed)
+    jobs, bullets, projects = CORPUS_SIZES[size]
+    return [generate_resume(rng, jobs, bullets, projects, noise) for _ in range(count)]
+
+def benchmark_parser_throughput(seed=0, output=None, baseline=None, tolerance=0.1):
+    """Report ResumeParser docs/sec and lines/sec on the generated corpus, optionally against a baseline"""
+    print(f"🚀 Benchmark: parser throughput on the generated corpus (seed {seed})")
+    print("=" * 60)
+    print(f"{'case':>26} {'docs/sec':>10} {'lines/sec':>12}")
+    resume_parser = ResumeParser()
+    results = {}
+    for size, count in (('small', 1000), ('medium', 500), ('large', 50)):
+        texts = [text for text, _ in generate_resume_corpus(count, seed, size)]
+        line_count = sum(text.count('\n') + 1 for text in texts)
+        for name, parse in (('parse_resume_text', resume_parser.parse_resume_text),
+                            ('parse_resume_lines', lambda text: resume_parser.parse_resume_lines(text.split('\n')))):
+            elapsed = time_call(lambda: [parse(text) for text in texts])
+            case = f"{name}/{size}"
+            results[case] = {'docs_per_sec': round(count / elapsed, 1), 'lines_per_sec': round(line_count / elapsed, 1)}
+            print(f"{case:>26} {results[case]['docs_per_sec']:>10.1f} {results[case]['lines_per_sec']:>12.1f}")
+
+    run = {'seed': seed, 'python': platform.python_version(), 'machine': platform.machine(),
+           'cpus': os.cpu_count(), 'results': results}
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(run, f, indent=2)
+        print(f"Saved results to {output}")
+    if baseline:
+        with open(baseline, encoding='utf-8') as f:
+            reference = json.load(f)['results']
+        print(f"\nCompared with {baseline} (lines/sec):")
+        regressions = []
+        for case, result in results.items():
+            if case not in reference:
+                continue
+            change = result['lines_per_sec'] / reference[case]['lines_per_sec'] - 1
+            flag = '  ⚠️ slower' if change < -tolerance else ''
+            print(f"{case:>26} {change:>+9.1%}{flag}")
+            if flag:
+                regressions.append(case)
+        if regressions:
+            print(f"{len(regressions)} case(s) more than {tolerance:.0%} slower than the baseline")
+    print()
+
+def _traced_size(build):
+    """Return the result of build() and the memory it still holds afterwards"""
+    tracemalloc.start()
+    try:
+        value = build()
+        return value, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+def benchmark_result_types(document_count=5000, seed=0):
+    """Compare parse results held as dicts with ResumeData, in memory and JSON round trips"""
+    print(f"🧱 Benchmark: {document_count} parse results as dicts vs ResumeData")
+    print("=" * 60)
+    resume_parser = ResumeParser()
+    results = [resume_parser.parse_resume(text) for text, _ in generate_resume_corpus(document_count, seed, 'small')]
+    as_dicts, dict_bytes = _traced_size(lambda: [result.to_dict() for result in results])
+    as_records, record_bytes = _traced_size(lambda: [ResumeData.from_dict(result) for result in as_dicts])
+    print(f"{'held in memory':>16}: dicts {dict_bytes / 1024:>8.0f}KB, ResumeData {record_bytes / 1024:>8.0f}KB "
+          f"({1 - record_bytes / dict_bytes:.0%} smaller)")
+
+    payloads = [result.to_json() for result in results]
+    dumps = time_call(lambda: [json.dumps(result) for result in as_dicts])
+    to_json = time_call(lambda: [result.to_json() for result in results])
+    loads = time_call(lambda: [json.loads(payload) for payload in payloads])
+    from_json = time_call(lambda: [ResumeData.from_json(payload) for payload in payloads])
+    print(f"{'to JSON':>16}: json.dumps(dict) {dumps * 1000:>7.1f}ms, to_json {to_json * 1000:>7.1f}ms")
+    print(f"{'from JSON':>16}: json.loads {loads * 1000:>7.1f}ms, from_json {from_json * 1000:>7.1f}ms")
+    assert all(ResumeData.from_json(payload) == result for payload, result in zip(payloads, results))
+    print()
+
+def _score_headers(corpus, found):
+    """Return (precision, recall, section accuracy) of found headers against the corpus labels"""
+    true_positives = false_positives = wrong_section = 0
+    expected = sum(len(labels) for _, labels in corpus)
+    for (_, labels), headers in zip(corpus, found):
+        for line_number, section in headers.items():
+            if line_number not in labels:
+                false_positives += 1
+                continue
+            true_positives += 1
+            wrong_section += section != labels[line_number]
+    precision = true_positives / max(true_positives + false_positives, 1)
+    recall = true_positives / max(expected, 1)
+    return precision, recall, 1 - wrong_section / max(true_positives, 1)
+
+def benchmark_header_engines(seed=0, document_count=2000):
+    """Compare the heuristic and NumPy-vectorised header classifiers on the generated corpus"""
+    print(f"🔎 Benchmark: section header engines on {document_count} generated resumes")
+    print("=" * 60)
+    if np is None:
+        print("NumPy is not installed; skipping (pip install numpy)")
+        print()
+        return
+    corpus = generate_resume_corpus(document_count, seed, 'medium')
+    texts = [text for text, _ in corpus]
+    line_count = sum(text.count('\n') + 1 for text in texts)
+
+    def heuristic():
+        found = []
+        for text in texts:
+            headers = {}
+            for line_number, line in enumerate(text.split('\n')):
+                header = ResumeParser.classify_header(line.strip())
+                if header is not None:
+                    headers[line_number] = header[0]
+            found.append(headers)
+        return found
+
+    def vector():
+        return [{line_number: header[0] for line_number, header in headers.items()}
+                for headers in VectorHeaderClassifier.classify_documents(texts)]
+
+    print(f"{'engine':>10} {'precision':>10} {'recall':>8} {'section':>8} {'lines/sec':>12} {'parse docs/sec':>15}")
+    resume_parser = ResumeParser()
+    parsed = {}
+    for engine, classify in (('heuristic', heuristic), ('vector', vector)):
+        precision, recall, section_accuracy = _score_headers(corpus, classify())
+        elapsed = time_call(classify)
+        parse_elapsed = time_call(lambda: parsed.__setitem__(engine, [
+            result['data'] for result in resume_parser.parse_many(texts, 1, chunksize=500, header_engine=engine)]), repeat=1)
+        print(f"{engine:>10} {precision:>10.1%} {recall:>8.1%} {section_accuracy:>8.1%} "
+              f"{line_count / elapsed:>12.0f} {document_count / parse_elapsed:>15.1f}")
+    agreement = sum(a == b for a, b in zip(parsed['heuristic'], parsed['vector'])) / document_count
+    print(f"parse results identical across engines for {agreement:.1%} of documents")
+
+    # The vector engine pays a fixed NumPy cost per call, so its speed depends on how
+    # many documents each call sees; parse_many hands it one chunk at a time
+    print(f"{'docs/batch':>10} {'heuristic lines/sec':>20} {'vector lines/sec':>17} {'ratio':>6}")
+    for batch in (1, 10, 100, 500, document_count):
+        batches = [texts[i:i + batch] for i in range(0, document_count, batch)]
+        plain = time_call(lambda: [ResumeParser.classify_header(line.strip())
+                                   for text in texts for line in text.split('\n')], repeat=5)
+        vectorised = time_call(lambda: [VectorHeaderClassifier.classify_documents(chunk) for chunk in batches], repeat=5)
+        print(f"{batch:>10} {line_count / plain:>20.0f} {line_count / vectorised:>17.0f} {plain / vectorised:>5.2f}x")
+    print()
+
+GOLDEN_RENDERS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_golden.json')
+
+def benchmark_template_render(count=2000):
+    """Time renders/sec of every template on the golden resumes
+
+    tests/test_templates.py checks the output against the golden digests.
+    """
+    print(f"🎨 Benchmark: website templates ({count} renders each)")
+    print("=" * 60)
+    with open(GOLDEN_RENDERS) as f:
+        golden = json.load(f)
+    generator = WebsiteGenerator()
+
+    def render_many(template, data):
+        for _ in range(count):
+            generator.render(template, data)
+
+    print(f"{'template':>10} {'full renders/sec':>18} {'sparse renders/sec':>20}")
+    for template in SITE_TEMPLATES:
+        rates = [count / time_call(render_many, template, data)
+                 for data in (golden['resumes']['full'], golden['resumes']['sparse'])]
+        print(f"{template:>10} {rates[0]:>18.0f} {rates[1]:>20.0f}")
+    print()
+
+def benchmark_render_cache(seed=0, user_count=200, toggles=12):
+    """Replay users flipping between templates, without and with the render cache"""
+    print(f"🗂️  Benchmark: render cache ({user_count} users, {toggles} template switches each)")
+    print("=" * 60)
+    parse_cache = ParseCache(256 * 1024 * 1024)
+    resumes = []
+    for text, _ in generate_resume_corpus(user_count, seed, 'medium'):
+        stats = {}
+        resumes.append((parse_cache.parse_resume_text(text, stats=stats), stats['key']))
+    templates = list(SITE_TEMPLATES)
+    # Every switch sends the data back as fresh JSON, as the browser does
+    requests = [(json.loads(json.dumps(resume)), key, templates[i % len(templates)])
+                for resume, key in resumes for i in range(toggles)]
+
+    def replay(generator):
+        for resume, key, template in requests:
+            generator.generate_website(resume, template, resume_key=key)
+
+    uncached = time_call(replay, WebsiteGenerator())
+    cached_generator = WebsiteGenerator(256 * 1024 * 1024)
+    cached = time_call(replay, cached_generator, repeat=1)
+    hit = time_call(replay, cached_generator)
+    print(f"{'no cache':>22}: {uncached / len(requests) * 1e6:>8.1f}us per switch")
+    print(f"{'cache, first replay':>22}: {cached / len(requests) * 1e6:>8.1f}us per switch")
+    print(f"{'cache, all hits':>22}: {hit / len(requests) * 1e6:>8.1f}us per switch")
+    stats = cached_generator.render_cache.stats()
+    assert stats['misses'] == len(resumes) * len(templates), "each (template, resume) should render once"
+
+    budget = 1024 * 1024
+    small = WebsiteGenerator(budget)
+    replay(small)
+    stats = small.render_cache.stats()
+    print(f"{'1MB budget':>22}: {stats['entries']} sites kept, {stats['evictions']} evicted, hit rate {stats['hit_rate']:.0%}")
+    assert stats['bytes'] <= budget and stats['evictions'] > 0
+    print()
+
+def benchmark_render_all(seed=0, user_count=200):
+    """Time WebsiteGenerator.render_all per upload, with the per-template breakdown"""
+    print(f"🖼️  Benchmark: all {len(SITE_TEMPLATES)} templates for {user_count} uploads with render_all")
+    print("=" * 60)
+    resume_parser = ResumeParser()
+    resumes = [resume_parser.parse_resume(text).to_dict() for text, _ in generate_resume_corpus(user_count, seed, 'medium')]
+    generator = WebsiteGenerator()
+    elapsed = time_call(lambda: [generator.render_all(resume) for resume in resumes])
+    print(f"{'render_all':>12}: {elapsed / user_count * 1000:>7.2f}ms per upload")
+    print(f"{'template':>12} {'renders':>8} {'mean':>10} {'max':>10}")
+    for template, totals in generator.metrics.snapshot().items():
+        print(f"{template:>12} {totals['renders']:>8} {totals['mean_seconds'] * 1e6:>8.1f}us {totals['max_seconds'] * 1e6:>8.1f}us")
+
+    cached = WebsiteGenerator(64 * 1024 * 1024)
+    stats = {}
+    cached.render_all(resumes[0], resume_key='resume-0')
+    cached.render_all(resumes[0], stats=stats, resume_key='resume-0')
+    assert stats == dict.fromkeys(SITE_TEMPLATES, 0.0), "a second render_all should be served from the cache"
+    print()
+
+def _live_edits(resume, rng):
+    """Yield (template, resume) for a user editing one field at a time between re-renders"""
+    templates = list(SITE_TEMPLATES)
+    template = templates[0]
+    yield template, resume
+    for step in range(12):
+        resume = dict(resume)
+        edit = step % 4
+        if edit == 0:
+            resume['summary'] = f"{resume['summary']} Edit {step}."
+        elif edit == 1:
+            resume['skills'] = list(resume['skills']) + [f'Skill {step}']
+        elif edit == 2 and resume['experience']:
+            entries = [dict(entry) for entry in resume['experience']]
+            entries[rng.randrange(len(entries))]['description'] += f' Edit {step}.'
+            resume['experience'] = entries
+        else:
+            template = templates[(templates.index(template) + 1) % len(templates)]
+        yield template, resume
+
+def benchmark_fragment_cache(seed=0, user_count=100):
+    """Replay live editing sessions, re-rendering by resume_key without and with section fragments"""
+    print(f"🧩 Benchmark: live editing, {user_count} users, 13 renders each")
+    print("=" * 60)
+    resume_parser = ResumeParser()
+    # No render cache: every edit misses it anyway, and its puts would dominate both timings
+    budget = 64 * 1024 * 1024
+    for size in ('medium', 'large'):
+        rng = random.Random(seed)
+        sessions = [list(_live_edits(resume_parser.parse_resume(text).to_dict(), rng))
+                    for text, _ in generate_resume_corpus(user_count, seed, size)]
+        renders = sum(len(session) for session in sessions)
+
+        def replay(generator):
+            for user, session in enumerate(sessions):
+                for template, resume in session:
+                    generator.generate_website(resume, template, resume_key=f'resume-{user}')
+
+        full = time_call(lambda: replay(WebsiteGenerator()))
+        fragments = time_call(lambda: replay(WebsiteGenerator(0, budget)))
+        print(f"{size:>7} {'full re-render':>18}: {full / renders * 1e6:>7.1f}us per render")
+        print(f"{size:>7} {'section fragments':>18}: {fragments / renders * 1e6:>7.1f}us per render ({full / fragments:.2f}x)")
+
+        generator = WebsiteGenerator(0, budget)
+        replay(generator)
+
+        plain = WebsiteGenerator()
+        for template, resume in sessions[0]:
+            assert generator.render(template, resume, 2026, 'resume-0') == plain.render(template, resume, 2026), "fragments must not change output"
+    print()
+
+def _traced_peak(func, *args):
+    """Return the peak memory allocated while func runs"""
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def benchmark_streaming_render():
+    """Time to first chunk and peak memory of a streamed page against a full render"""
+    print("🌊 Benchmark: streamed vs full page render (artistic template)")
+    print("=" * 60)
+    print(f"{'entries':>8} {'page KB':>8} {'first chunk':>12} {'full render':>12} {'stream peak':>12} {'full peak':>10}")
+    generator = WebsiteGenerator()
+    base = ResumeData(name='Jane Smith', title='Engineer', summary='Builds things.').to_dict()
+    for entry_count in (10, 100, 1000, 10000):
+        resume = dict(base, experience=[
+            {'title': f'Role {i}', 'company': f'Company {i}', 'description': 'Shipped a feature. ' * 10}
+            for i in range(entry_count)])
+
+        def first_chunk():
+            return next(iter(generator.iter_website('artistic', resume)))
+
+        def drain():
+            for _ in generator.iter_website('artistic', resume):
+                pass
+
+        page = generator.render('artistic', resume)['index.html']
+        first = time_call(first_chunk)
+        full = time_call(generator.render, 'artistic', resume)
+        stream_peak = _traced_peak(drain)
+        full_peak = _traced_peak(generator.render, 'artistic', resume)
+        print(f"{entry_count:>8} {len(page) / 1024:>8.0f} {first * 1000:>10.2f}ms {full * 1000:>10.2f}ms "
+              f"{stream_peak / 1024:>10.0f}KB {full_peak / 1024:>8.0f}KB")
+    print()
+
+# 100KB lines built to make a backtracking matcher revisit the same characters
+PATHOLOGICAL_LINES = {
+    'digits': lambda n: '1' * n,
+    'digit-space': lambda n: '1 ' * (n // 2),
+    'dashes': lambda n: '-' * n,
+    'paren-dash': lambda n: '(-' * (n // 2),
+    'dotted-words': lambda n: 'a.' * (n // 2),
+    'at-runs': lambda n: 'a@' * (n // 2),
+    'local-no-at': lambda n: 'a' * (n - 1) + '@',
+    'domain-no-tld': lambda n: 'a@' + 'b.1' * ((n - 2) // 3),
+    'www-runs': lambda n: 'www.' * (n // 4),
+    'bare-domain': lambda n: 'x.' * (n // 2) + 'zz',
+}
+
+def _random_noise(rng, length, alphabet='0123456789 -()+.@ab\t'):
+    return ''.join(rng.choice(alphabet) for _ in range(length))
+
+def benchmark_contact_fuzz(seed=0, size=100_000):
+    """Time the contact scanner on hostile lines and count planted contacts it finds
+
+    tests/test_contacts.py enforces the limits; this reports the numbers.
+    """
+    print("🧪 Benchmark: contact scanner on adversarial input")
+    print("=" * 60)
+    print(f"{'line':>14} {'50KB':>10} {'100KB':>10} {'ratio':>7}")
+    for name, build in PATHOLOGICAL_LINES.items():
+        half = time_call(ResumeParser.extract_contacts, build(size // 2))
+        full = time_call(ResumeParser.extract_contacts, build(size))
+        # Linear growth doubles the time
+        ratio = full / half
+        print(f"{name:>14} {half * 1000:>8.2f}ms {full * 1000:>8.2f}ms {ratio:>6.1f}x")
+
+    rng = random.Random(seed)
+    for name, build in (('random', lambda n: _random_noise(rng, n)),):
+        full = time_call(ResumeParser.extract_contacts, build(size))
+        print(f"{name:>14} {'':>10} {full * 1000:>8.2f}ms")
+
+    legacy = time_call(_legacy_contact_scan, PATHOLOGICAL_LINES['dotted-words'](5_000), repeat=1)
+    print(f"legacy scanner on 5KB of dotted words: {legacy * 1000:.2f}ms")
+
+    missed = 0
+    for _ in range(500):
+        email = f"{rng.choice(['jane', 'j.doe', 'a_b+cv'])}@{rng.choice(['mail', 'my-site', 'x.co'])}.{rng.choice(['com', 'io', 'org'])}"
+        phone = f"+1 ({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}"
+        # Noise without digits or '@', so the planted values are the only real contacts
+        noise = [_random_noise(rng, 30, 'abc .-()+\t') for _ in range(2)]
+        text = f"{noise[0]} {email} | {phone}. {noise[1]}"
+        contacts = ResumeParser.extract_contacts(text)
+        if contacts.get('email') != email or phone not in contacts.get('phone', ''):
+            missed += 1
+            if missed <= 3:
+                print(f"missed: {text!r} -> {contacts}")
+    print(f"planted contacts found in {500 - missed}/500 noisy lines")
+    print()
+
+BENCHMARKS = {
+    'pdf': lambda args: benchmark_pdf_extraction(args.workers),
+    'pdfmem': lambda args: benchmark_pdf_memory(),
+    'docx': lambda args: benchmark_docx_extraction(),
+    'stream': lambda args: benchmark_streaming_parse(),
+    'contacts': lambda args: benchmark_contact_scan(),
+    'contacts-fuzz': lambda args: benchmark_contact_fuzz(),
+    'skills': lambda args: benchmark_skill_accumulation(),
+    'batch': lambda args: benchmark_batch_parsing(args.workers),
+    'parsememo': lambda args: benchmark_parse_memo(),
+    'results': lambda args: benchmark_result_types(seed=args.seed),
+    'headers': lambda args: benchmark_header_engines(args.seed),
+    'throughput': lambda args: benchmark_parser_throughput(args.seed, args.output, args.baseline),
+    'render': lambda args: benchmark_template_render(),
+    'rendercache': lambda args: benchmark_render_cache(args.seed),
+    'renderall': lambda args: benchmark_render_all(args.seed),
+    'fragments': lambda args: benchmark_fragment_cache(args.seed),
+    'streamrender': lambda args: benchmark_streaming_render(),
+}
+
+def main():
+    """Run the selected benchmarks"""
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('benchmarks', nargs='*', choices=sorted(BENCHMARKS), help='benchmarks to run (default: all)')
+    arg_parser.add_argument('--workers', type=int, default=max(2, min(4, os.cpu_count() or 1)), help='worker processes for parallel modes')
+    arg_parser.add_argument('--seed', type=int, default=0, help='seed for the generated resume corpus')
+    arg_parser.add_argument('--output', help='save throughput results to this JSON file')
+    arg_parser.add_argument('--baseline', help='compare throughput results with this saved JSON file')
+    args = arg_parser.parse_args()
+
+    print("⏱️  Personal Website Creator - Benchmarks")
+    print("=" * 60)
+    print()
+    for name in args.benchmarks or BENCHMARKS:
+        BENCHMARKS[name](args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+document.querySelectorAll('a[href^="#"]').forEach(anchor => {{
+            anchor.addEventListener('click', function (e) {{
+                e.preventDefault();
+                document.querySelector(this.getAttribute('href')).scrollIntoView({{
+                    behavior: 'smooth'
+                }});
+            }});
+        }});
+
+        window.addEventListener('scroll', () => {{
+            const navbar = document.querySelector('.navbar');
+            if (window.scrollY > 100) {{
+                navbar.style.background = 'rgba(255, 255, 255, 0.98)';
+            }} else {{
+                navbar.style.background = 'rgba(255, 255, 255, 0.95)';
+            }}
+        }});
\ No newline at end of file
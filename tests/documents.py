@@ -0,0 +1,103 @@
+"""Small hand-built documents for the tests"""
+
+import struct
+
+
+def _pdf(objects):
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    return bytes(out)
+
+
+def build_pdf(pages):
+    """Build a PDF from a list of pages, each a list of text lines or None for a scanned image page"""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Type /XObject /Subtype /Image /Width 1 /Height 1 /ColorSpace /DeviceGray "
+        b"/BitsPerComponent 8 /Length 1 >>\nstream\n\x80\nendstream",
+    ]
+    page_ids = []
+    for lines in pages:
+        if lines is None:
+            stream = b"q 612 0 0 792 0 0 cm /Im1 Do Q"
+            resources = b"<< /XObject << /Im1 4 0 R >> >>"
+        else:
+            shown = "\n".join(f"({line}) Tj T*" for line in lines)
+            stream = ("BT /F1 11 Tf 14 TL 40 760 Td\n" + shown + "\nET").encode('latin-1')
+            resources = b"<< /Font << /F1 3 0 R >> >>"
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources %s /Contents %d 0 R >>"
+                       % (resources, len(objects)))
+        page_ids.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(pages))
+    return _pdf(objects)
+
+
+_OLE_FREE = 0xFFFFFFFF
+_OLE_END = 0xFFFFFFFE
+
+
+def _ole_header(fat_sectors, first_dir, first_difat, difat_sectors, fat_ids):
+    header = bytearray(512)
+    header[:8] = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+    struct.pack_into('<HHHHH', header, 0x18, 0x3E, 3, 0xFFFE, 9, 6)
+    struct.pack_into('<8I', header, 0x2C, fat_sectors, first_dir, 0, 4096, _OLE_END, 0,
+                     first_difat, difat_sectors)
+    ids = list(fat_ids) + [_OLE_FREE] * (109 - len(fat_ids))
+    struct.pack_into('<109I', header, 0x4C, *ids)
+    return header
+
+
+def _ole_entry(name, entry_type, start, size):
+    entry = bytearray(128)
+    encoded = (name + "\0").encode('utf-16-le')
+    entry[:len(encoded)] = encoded
+    struct.pack_into('<HB', entry, 0x40, len(encoded), entry_type)
+    struct.pack_into('<4I', entry, 0x44, _OLE_FREE, _OLE_FREE, _OLE_FREE, 0)
+    struct.pack_into('<II', entry, 0x74, start, size)
+    return bytes(entry)
+
+
+def build_doc(text):
+    """Build a Word 97 .doc whose body is the given cp1252 text, stored as one piece"""
+    body = text.encode('cp1252')
+    word = bytearray(4096)
+    struct.pack_into('<6H', word, 0, 0xA5EC, 0xC1, 0, 0x0409, 0, 0x0200)  # text table in 1Table
+    struct.pack_into('<H', word, 32, 14)         # csw, then 14 words of FibRgW97
+    struct.pack_into('<H', word, 62, 22)         # cslw, then 22 longs of FibRgLw97
+    struct.pack_into('<I', word, 64 + 12, len(body))  # ccpText
+    struct.pack_into('<H', word, 152, 93)        # cbRgFcLcb
+    clx = struct.pack('<BI', 0x02, 16) + struct.pack('<2I', 0, len(body))
+    clx += struct.pack('<HIH', 0, (1024 * 2) | 0x40000000, 0)  # compressed piece at byte 1024
+    struct.pack_into('<II', word, 154 + 33 * 8, 0, len(clx))   # fcClx, lcbClx
+    word[1024:1024 + len(body)] = body
+    table = clx.ljust(4096, b"\0")
+
+    # Sector 0 holds the FAT, 1 the directory, then 8 sectors for each stream
+    fat = [0xFFFFFFFD, _OLE_END]
+    for first in (2, 10):
+        fat += list(range(first + 1, first + 8)) + [_OLE_END]
+    fat += [_OLE_FREE] * (128 - len(fat))
+    directory = (_ole_entry("Root Entry", 5, _OLE_END, 0)
+                 + _ole_entry("WordDocument", 2, 2, len(word))
+                 + _ole_entry("1Table", 2, 10, len(table))
+                 + bytes(128))
+    return bytes(_ole_header(1, 1, _OLE_END, 0, [0]) + struct.pack('<128I', *fat)
+                 + directory + word + table)
+
+
+def build_looping_doc():
+    """Build an OLE2 header whose DIFAT chain points back at itself and claims 2^32 - 2 sectors"""
+    difat = [0] * 128  # the last entry links sector 0 to itself
+    return bytes(_ole_header(1, 1, 0, 0xFFFFFFFE, [0]) + struct.pack('<128I', *difat))
@@ -0,0 +1,40 @@
+import random
+import time
+
+import pytest
+
+from app import ResumeParser
+
+# 100KB lines built to make a backtracking matcher revisit the same characters
+HOSTILE_LINES = {
+    'digits': '1' * 100_000,
+    'digit-space': '1 ' * 50_000,
+    'dashes': '-' * 100_000,
+    'paren-dash': '(-' * 50_000,
+    'dotted-words': 'a.' * 50_000,
+    'at-runs': 'a@' * 50_000,
+    'local-no-at': 'a' * 99_999 + '@',
+    'domain-no-tld': 'a@' + 'b.1' * 33_332,
+    'www-runs': 'www.' * 25_000,
+    'bare-domain': 'x.' * 50_000 + 'zz',
+}
+
+
+@pytest.mark.parametrize('line', HOSTILE_LINES.values(), ids=HOSTILE_LINES.keys())
+def test_hostile_lines_scan_in_linear_time(line):
+    # A linear scan of 100KB takes a few milliseconds; backtracking takes seconds
+    start = time.perf_counter()
+    ResumeParser.extract_contacts(line)
+    assert time.perf_counter() - start < 0.25
+
+
+def test_planted_contacts_are_found_in_noise():
+    rng = random.Random(0)
+    for _ in range(200):
+        email = f"{rng.choice(['jane', 'j.doe', 'a_b+cv'])}@{rng.choice(['mail', 'my-site', 'x.co'])}.{rng.choice(['com', 'io', 'org'])}"
+        phone = f"+1 ({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}"
+        # Noise without digits or '@', so the planted values are the only real contacts
+        noise = [''.join(rng.choice('abc .-()+\t') for _ in range(30)) for _ in range(2)]
+        contacts = ResumeParser.extract_contacts(f"{noise[0]} {email} | {phone}. {noise[1]}")
+        assert contacts.get('email') == email
+        assert phone in contacts.get('phone', '')
@@ -0,0 +1,75 @@
+import io
+import time
+import zipfile
+
+import pytest
+from docx import Document
+
+from app import FileParser, OleCompoundFile
+from documents import build_doc, build_looping_doc, build_pdf
+
+
+def test_word97_text_is_extracted():
+    doc = build_doc("Jane Doe\rSoftware Engineer\r\x13 HYPERLINK \x14jane@example.com\x15\rSkills\x07Python")
+    text = FileParser.extract_text(io.BytesIO(doc), 'doc')
+    assert text.splitlines() == ['Jane Doe', 'Software Engineer', 'jane@example.com', 'Skills', 'Python']
+
+
+def test_looping_difat_chain_fails_fast():
+    data = build_looping_doc()
+    with pytest.raises(ValueError):
+        OleCompoundFile(data)
+    start = time.perf_counter()
+    assert FileParser.extract_text_from_doc(data) == ""
+    assert time.perf_counter() - start < 1
+
+
+def test_oversized_sector_shift_is_rejected():
+    data = bytearray(build_doc("Jane Doe"))
+    data[0x1E] = 0xFF
+    with pytest.raises(ValueError):
+        OleCompoundFile(bytes(data))
+    assert FileParser.extract_text_from_doc(bytes(data)) == ""
+
+
+def _docx_bytes(embedded_pdf=False):
+    document = Document()
+    document.add_paragraph("Jane Doe")
+    buffer = io.BytesIO()
+    document.save(buffer)
+    if not embedded_pdf:
+        return buffer.getvalue()
+    # Put a stored PDF at the very front of the package, inside the sniffed window
+    out = io.BytesIO()
+    with zipfile.ZipFile(buffer) as source, zipfile.ZipFile(out, 'w') as package:
+        package.writestr('word/embeddings/cv.pdf', build_pdf([['Jane Doe']]), zipfile.ZIP_STORED)
+        for item in source.infolist():
+            package.writestr(item, source.read(item.filename))
+    return out.getvalue()
+
+
+def _doc_with_pdf_marker():
+    data = bytearray(build_doc("Jane Doe"))
+    data[512 + 384:512 + 384 + 9] = b'%PDF-1.4\n'  # unused fourth directory entry
+    return bytes(data)
+
+
+SNIFF_CASES = {
+    'pdf': (build_pdf([['Jane Doe']]), 'pdf'),
+    'pdf-after-blank-lines': (b'\n' * 10 + build_pdf([['Jane Doe']]), 'pdf'),
+    'doc': (build_doc("Jane Doe"), 'doc'),
+    'doc-with-pdf-marker': (_doc_with_pdf_marker(), 'doc'),
+    'docx': (_docx_bytes(), 'docx'),
+    'docx-embedding-pdf': (_docx_bytes(embedded_pdf=True), 'docx'),
+    'rtf': (b'{\\rtf1\\ansi Jane Doe\\par}', 'rtf'),
+    'zip-not-docx': (b'PK\x03\x04' + bytes(60), None),
+    'utf8': ("Jane Doe\nSkills: Python".encode('utf-8'), 'txt'),
+    'cp1252': ("José García\nIngeniero".encode('cp1252'), 'txt'),
+    'utf16': ("Jane Doe".encode('utf-16'), 'txt'),
+    'binary': (bytes(range(256)), None),
+}
+
+
+@pytest.mark.parametrize('data, expected', SNIFF_CASES.values(), ids=SNIFF_CASES.keys())
+def test_sniff_format(data, expected):
+    assert FileParser.sniff_format(io.BytesIO(data)) == expected
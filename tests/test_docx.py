@@ -0,0 +1,50 @@
+import io
+import zipfile
+
+from docx import Document
+
+from app import FileParser
+
+
+def _docx(document):
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+
+def _move_main_part(data, name='word/document2.xml'):
+    """Rename word/document.xml, as some editors do; the package relationships still find it"""
+    out = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(data)) as source, zipfile.ZipFile(out, 'w') as target:
+        for item in source.infolist():
+            content = source.read(item.filename)
+            if item.filename in ('[Content_Types].xml', '_rels/.rels'):
+                content = content.replace(b'word/document.xml', name.encode())
+            target.writestr(name if item.filename == 'word/document.xml' else item.filename, content)
+    return out.getvalue()
+
+
+def test_table_cells_come_between_the_paragraphs_around_them():
+    document = Document()
+    document.add_paragraph('Jane Doe')
+    table = document.add_table(rows=2, cols=2)
+    for cell, text in zip(table._cells, ['Experience', 'Engineer at Acme', 'Skills', 'Python, Go']):
+        cell.text = text
+    document.add_paragraph('References on request')
+    with io.BytesIO(_docx(document)) as file:
+        assert list(FileParser.iter_docx_paragraphs(file)) == [
+            'Jane Doe', 'Experience', 'Engineer at Acme', 'Skills', 'Python, Go', 'References on request']
+
+
+def test_package_without_word_document_xml_falls_back_to_python_docx():
+    document = Document()
+    document.add_paragraph('Jane Doe')
+    document.add_paragraph('Software Engineer')
+    data = _move_main_part(_docx(document))
+    with zipfile.ZipFile(io.BytesIO(data)) as package:
+        assert 'word/document.xml' not in package.namelist()
+    stats = {}
+    assert FileParser.extract_text_from_docx(data, stats=stats) == 'Jane Doe\nSoftware Engineer\n'
+    assert stats['engine'] == 'python-docx'
+    assert list(FileParser.iter_text_lines(data, 'docx', stats=stats)) == ['Jane Doe', 'Software Engineer', '']
+    assert stats['engine'] == 'python-docx'
@@ -0,0 +1,25 @@
+import pytest
+
+from app import ParseCache
+
+RESUME = "Jane Doe\nSoftware Engineer\n\nExperience\nEngineer at Acme\n\nSkills\nPython, Go\n"
+
+
+def test_same_text_is_parsed_once():
+    cache = ParseCache(1024 * 1024)
+    first = cache.parse_resume_text(RESUME)
+    assert cache.parse_resume_text(RESUME) is first
+    # Whitespace at line ends is ignored, line breaks are not
+    assert cache.parse_resume_text(RESUME.replace('\n', '  \n')) is first
+    assert cache.stats()['misses'] == 1
+
+
+def test_results_are_frozen():
+    result = ParseCache(1024 * 1024).parse_resume_text(RESUME)
+    with pytest.raises(TypeError):
+        result['name'] = 'John Roe'
+    with pytest.raises(AttributeError):
+        result['skills'].append('Rust')
+    with pytest.raises(TypeError):
+        result['experience'][0]['title'] = 'CTO'
+
@@ -0,0 +1,55 @@
+import io
+
+import pytest
+from docx import Document
+
+from app import FileParser, ResumeParser
+from documents import build_pdf
+
+RESUMES = {
+    # Skills header with its items on the same line; a website in the contact header
+    'inline-skills': (
+        ["jane@example.com | 555-123-4567", "Jane Doe", "Software Engineer", "janedoe.dev", "",
+         "Summary", "Engineer who ships reliable services.", "Experience", "Engineer at Acme",
+         "Built the billing system.", "Skills: Python, Go, SQL", "Projects", "Demo at https://example.org/demo"],
+        {'name': 'Jane Doe', 'skills': ['Python', 'Go', 'SQL'], 'website': 'https://janedoe.dev'}),
+    # The name is the last of the three lines it may be on
+    'name-on-line-2': (
+        ["jane@example.com", "555-123-4567", "Jane Doe", "Experience", "Engineer at Acme",
+         "Skills", "Python, Go"],
+        {'name': 'Jane Doe', 'skills': ['Python', 'Go'], 'website': ''}),
+    # A URL after the contact header is not the candidate's website
+    'late-website': (
+        ["Jane Doe", "Software Engineer", "jane@example.com", "", "Experience", "Engineer at Acme",
+         "Skills", "Python, Go", "", "Projects", "Portfolio at janedoe.dev"],
+        {'name': 'Jane Doe', 'skills': ['Python', 'Go'], 'website': ''}),
+}
+
+
+def _docx(lines):
+    document = Document()
+    for line in lines:
+        document.add_paragraph(line)
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+
+def _sources(lines):
+    return {
+        'txt': '\n'.join(lines).encode('utf-8'),
+        'pdf': build_pdf([lines[:5], lines[5:]]),
+        'docx': _docx(lines),
+    }
+
+
+@pytest.mark.parametrize('file_ext', ['txt', 'pdf', 'docx'])
+@pytest.mark.parametrize('resume', sorted(RESUMES))
+def test_streamed_lines_parse_like_the_whole_text(resume, file_ext):
+    lines, expected = RESUMES[resume]
+    source = _sources(lines)[file_ext]
+    parser = ResumeParser()
+    whole = parser.parse_resume(FileParser.extract_text(source, file_ext)).to_dict()
+    streamed = parser.parse_resume_lines(FileParser.iter_text_lines(source, file_ext)).to_dict()
+    assert streamed == whole
+    assert {field: streamed[field] for field in expected} == expected
@@ -0,0 +1,41 @@
+import os
+
+from app import ResumeParser
+
+
+class WorkerKiller(str):
+    """A resume text that takes its worker process down when parsed"""
+
+    def split(self, *args):
+        os._exit(1)
+
+
+def resumes(count):
+    return [f'Person {i}\nperson{i}@example.com\n\nSkills\nPython, Go' for i in range(count)]
+
+
+def test_results_in_input_order():
+    texts = resumes(50)
+    results = list(ResumeParser().parse_many(texts, workers=2, chunksize=4))
+    assert [result['index'] for result in results] == list(range(50))
+    assert all(result['success'] for result in results)
+    assert results[7]['data'].name == 'Person 7'
+
+
+def test_bad_document_is_reported_without_stopping_the_batch():
+    texts = resumes(5)
+    texts[2] = None
+    results = list(ResumeParser().parse_many(texts, workers=1))
+    assert [result['success'] for result in results] == [True, True, False, True, True]
+
+
+def test_worker_crash_fails_only_chunks_in_flight():
+    texts = resumes(241)
+    texts[40] = WorkerKiller(texts[40])
+    results = list(ResumeParser().parse_many(texts, workers=2, chunksize=8))
+    assert [result['index'] for result in results] == list(range(241))
+    failed = [result['index'] for result in results if not result['success']]
+    assert 40 in failed
+    # At most the chunks in flight with the crash (two per worker) are lost
+    assert len(failed) <= 2 * 2 * 8
+    assert all(result['success'] for result in results[100:])
@@ -0,0 +1,34 @@
+import pdfplumber
+
+from app import FileParser
+from documents import build_pdf
+
+
+def test_text_after_scanned_cover_page_is_extracted():
+    pdf = build_pdf([None, ['Jane Doe', 'Experience', 'Engineer at Acme']])
+    stats = {}
+    text = FileParser.extract_text_from_pdf(pdf, stats=stats)
+    assert 'Engineer at Acme' in text
+    assert not stats.get('image_only')
+
+
+def test_all_scanned_pages_is_image_only():
+    stats = {}
+    assert FileParser.extract_text_from_pdf(build_pdf([None, None]), stats=stats) == ''
+    assert stats['image_only'] and stats['engine'] == 'none'
+
+
+def test_page_the_engine_fails_on_falls_back_alone(monkeypatch):
+    original = pdfplumber.page.Page.extract_text
+
+    def broken_on_page_two(page, *args, **kwargs):
+        if page.page_number == 2:
+            raise ValueError('unsupported content stream')
+        return original(page, *args, **kwargs)
+
+    monkeypatch.setattr(pdfplumber.page.Page, 'extract_text', broken_on_page_two)
+    pdf = build_pdf([['Jane Doe'], ['Engineer at Acme'], ['Python, Go']])
+    stats = {}
+    text = FileParser.extract_text_from_pdf(pdf, engine='pdfplumber', stats=stats)
+    assert text.split() == ['Jane', 'Doe', 'Engineer', 'at', 'Acme', 'Python,', 'Go']
+    assert stats['pages_by_engine'] == {'pdfplumber': 2, 'pypdf2': 1}
@@ -0,0 +1,23 @@
+import sys
+import tracemalloc
+
+from app import FileParser
+from documents import build_pdf
+
+
+def _extraction_overhead(page_count):
+    pdf = build_pdf([[f'Line {line} of page {page}, describing work done at Acme' for line in range(30)]
+                     for page in range(page_count)])
+    tracemalloc.start()
+    try:
+        text = FileParser.extract_text_from_pdf(pdf, engine='pdfplumber')
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert text.count('\n') >= page_count * 30 - 1
+    # The extracted text itself has to grow with the page count; everything else should not
+    return peak - sys.getsizeof(text)
+
+
+def test_pdf_extraction_peak_memory_is_flat_in_page_count():
+    assert _extraction_overhead(16) < 1.5 * _extraction_overhead(4)
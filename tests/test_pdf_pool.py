@@ -0,0 +1,32 @@
+import os
+import signal
+
+import app
+from app import FileParser
+from documents import build_pdf
+
+
+def resume_pdf(page_count):
+    return build_pdf([[f'Page {page} line {line}' for line in range(5)] for page in range(page_count)])
+
+
+def kill_pool_worker():
+    pool = app._get_pdf_pool()
+    pool.submit(os.getpid).result()  # make sure the workers exist
+    os.kill(next(iter(pool._processes)), signal.SIGKILL)
+    return pool
+
+
+def test_broken_pdf_pool_falls_back_and_is_replaced():
+    pdf = resume_pdf(app.PDF_PARALLEL_MIN_PAGES * 2)
+    broken = kill_pool_worker()
+
+    stats = {}
+    text = FileParser.extract_text_from_pdf(pdf, max_workers=2, engine='pdfplumber', stats=stats)
+    assert stats['engine'] == 'pdfplumber'
+    assert text.count('line 0') == app.PDF_PARALLEL_MIN_PAGES * 2
+    assert app._get_pdf_pool() is not broken
+
+    stats = {}
+    text = FileParser.extract_text_from_pdf(pdf, max_workers=2, stats=stats)
+    assert stats['engine'] != 'failed' and 'Page 15 line 4' in text
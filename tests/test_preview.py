@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+import app
+
+GOLDEN = json.load(open(app.os.path.join(app.os.path.dirname(app.__file__), 'benchmark_golden.json')))
+
+
+@pytest.fixture
+def client():
+    return app.app.test_client()
+
+
+@pytest.mark.parametrize('template', list(app.SITE_TEMPLATES))
+def test_preview_streams_the_rendered_page(client, template):
+    resume = GOLDEN['resumes']['full']
+    response = client.post('/api/preview-website', json={'resume_data': resume, 'template': template})
+    assert response.status_code == 200
+    assert response.is_streamed and response.mimetype == 'text/html'
+    assert response.get_data(as_text=True) == app.generator.render(template, resume)['index.html']
+
+
+@pytest.mark.parametrize('template, resume_data', [
+    ('modern', {'name': 'Jane', 'title': 'Engineer', 'summary': 'Builds things.'}),
+    ('minimal', {'title': 'Engineer'}),
+    *[(template, dict(GOLDEN['resumes']['sparse'], experience=[{'company': 'c'}])) for template in app.SITE_TEMPLATES],
+    *[(template, dict(GOLDEN['resumes']['sparse'], skills=5)) for template in app.SITE_TEMPLATES],
+])
+def test_preview_rejects_incomplete_data_before_streaming(client, template, resume_data):
+    response = client.post('/api/preview-website', json={'resume_data': resume_data, 'template': template})
+    assert response.status_code == 400
+    assert 'missing' in response.get_json()['error']
+
+
+@pytest.mark.parametrize('template', ['minimal', 'creative', 'artistic'])
+def test_preview_accepts_what_generate_website_renders(client, template):
+    resume = {'name': 'Jane', 'title': 'Engineer', 'summary': 'Builds things.'}
+    generated = client.post('/api/generate-website', json={'resume_data': resume, 'template': template}).get_json()
+    response = client.post('/api/preview-website', json={'resume_data': resume, 'template': template})
+    assert response.status_code == 200
+    assert response.get_data(as_text=True) == generated['website_files']['index.html']
+
+
+@pytest.mark.parametrize('template', list(app.SITE_TEMPLATES))
+def test_required_fields_match_what_the_builders_read(template):
+    generator = app.WebsiteGenerator()
+    required = [field for build in generator.TEMPLATE_SECTIONS[template].values()
+                for field in generator.SECTION_REQUIRED_FIELDS[build]]
+    data = {field: 'x' for field in required if '[]' not in field}
+    data['experience'] = [{'title': 'Engineer'}]
+    assert generator.missing_fields(data, template) == []
+    generator.render(template, data)  # everything else is optional
+    for field in data:
+        incomplete = {name: value for name, value in data.items() if name != field}
+        if field != 'experience':
+            assert generator.missing_fields(incomplete, template) == [field]
+            with pytest.raises(KeyError):
+                generator.render(template, incomplete)
+
+
+def test_iter_website_chunks_join_to_the_page():
+    generator = app.WebsiteGenerator()
+    resume = GOLDEN['resumes']['full']
+    for chunk_size in (1, 100, None, 10 ** 7):
+        chunks = generator.iter_website('artistic', resume, year=2026, chunk_size=chunk_size)
+        assert ''.join(chunks) == generator.render('artistic', resume, 2026)['index.html']
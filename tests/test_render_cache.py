@@ -0,0 +1,64 @@
+import json
+
+import app
+
+RESUME = "Jane Doe\nSoftware Engineer\njane@example.com\n\nExperience\nEngineer at Acme\n\nSkills\nPython, Go\n"
+
+
+def test_switching_template_with_resume_key_is_a_cache_hit():
+    generator = app.WebsiteGenerator(1024 * 1024)
+    parse = {}
+    data = app.ParseCache(1024 * 1024).parse_resume_text(RESUME, stats=parse)
+    generator.render_all(data, resume_key=parse['key'])
+    sent_back = json.loads(json.dumps(data))
+    stats = generator.render_cache.stats()
+    files = generator.generate_website(sent_back, 'minimal', resume_key=parse['key'])
+    assert generator.render_cache.stats()['hits'] == stats['hits'] + 1
+    assert files == generator.render('minimal', sent_back)
+
+
+def test_edited_data_is_not_served_from_another_resumes_entry():
+    generator = app.WebsiteGenerator(1024 * 1024)
+    data = app.ResumeParser().parse_resume_text(RESUME)
+    generator.generate_website(data, 'modern', resume_key='k')
+    edited = dict(data, name='John Roe')
+    assert 'John Roe' in generator.generate_website(edited, 'modern', resume_key='k')['index.html']
+    assert 'Jane Doe' in generator.generate_website(data, 'modern', resume_key='k')['index.html']
+
+
+def test_requests_without_resume_key_skip_the_cache():
+    generator = app.WebsiteGenerator(1024 * 1024)
+    data = app.ResumeParser().parse_resume_text(RESUME)
+    generator.generate_website(data, 'modern')
+    assert generator.render_cache.stats()['entries'] == 0
+
+
+def test_upload_returns_the_key_for_later_switches():
+    client = app.app.test_client()
+    response = client.post('/api/parse-resume', json={'resume_text': RESUME}).get_json()
+    switched = client.post('/api/generate-website', json={
+        'resume_data': response['parsed_data'], 'resume_key': response['resume_key'], 'template': 'creative'}).get_json()
+    assert switched['success'] and switched['resume_key'] == response['resume_key']
+    assert switched['website_files'] == app.generator.render('creative', response['parsed_data'])
+
+
+def test_an_edit_rebuilds_only_the_sections_it_touches():
+    generator = app.WebsiteGenerator(1024 * 1024, 1024 * 1024)
+    data = app.ResumeParser().parse_resume_text(RESUME)
+    generator.generate_website(data, 'modern', resume_key='k')
+    before = {section: generator.fragment_cache.get(('modern', section, 'k')) for section in generator.SECTION_INPUTS}
+    edited = dict(data, skills=['Python', 'Go', 'Rust'])
+    files = generator.generate_website(edited, 'modern', resume_key='k')
+    after = {section: generator.fragment_cache.get(('modern', section, 'k')) for section in generator.SECTION_INPUTS}
+    assert [section for section in before if after[section] is not before[section]] == ['skills']
+    assert files == app.WebsiteGenerator().render('modern', edited)
+
+
+def test_a_fragment_is_reused_only_for_its_resume_and_unchanged_fields():
+    generator = app.WebsiteGenerator(0, 1024 * 1024)
+    data = app.ResumeParser().parse_resume_text(RESUME)
+    generator.render('modern', data, 2026, 'k')
+    other = dict(data, name='John Roe', experience=[{'title': 'Chef'}])
+    page = generator.render('modern', other, 2026, 'k')['index.html']
+    assert 'John Roe' in page and 'Chef' in page and 'Jane Doe' not in page
+    assert generator.render('modern', data, 2026, 'other')['index.html'] == app.WebsiteGenerator().render('modern', data, 2026)['index.html']
@@ -0,0 +1,58 @@
+import os
+import signal
+
+import pytest
+
+from app import ExtractionError, ExtractionSandbox
+from documents import build_pdf
+
+RESUME = b"Jane Doe\nSoftware Engineer\n"
+
+
+@pytest.fixture
+def sandbox():
+    sandbox = ExtractionSandbox(1, timeout=10, cpu_seconds=20, memory_bytes=1024 * 1024 * 1024)
+    sandbox.start()
+    yield sandbox
+    sandbox.shutdown()
+
+
+def worker_pid(sandbox):
+    (process, _), = sandbox._all
+    return process.pid
+
+
+def test_text_is_extracted_in_a_worker(sandbox):
+    stats = {}
+    assert sandbox.extract_text(RESUME, 'txt', stats=stats) == RESUME.decode()
+    assert stats['format'] == 'txt'
+    assert sandbox.stats()['completed'] == 1
+
+
+def test_slow_extraction_times_out_and_the_worker_is_replaced(sandbox):
+    slow = build_pdf([[f'Page {page} line {line}' for line in range(40)] for page in range(200)])
+    sandbox.timeout = 0.02
+    first = worker_pid(sandbox)
+    with pytest.raises(ExtractionError, match='longer than'):
+        sandbox.extract_text(slow, 'pdf')
+    assert sandbox.stats()['recycled'] == 1
+    sandbox.timeout = 10
+    assert worker_pid(sandbox) != first
+    assert sandbox.extract_text(RESUME, 'txt') == RESUME.decode()
+
+
+def test_dead_worker_is_reported_and_replaced(sandbox):
+    first = worker_pid(sandbox)
+    os.kill(first, signal.SIGKILL)
+    with pytest.raises(ExtractionError, match='resources'):
+        sandbox.extract_text(RESUME, 'txt')
+    assert worker_pid(sandbox) != first
+    assert sandbox.extract_text(RESUME, 'txt') == RESUME.decode()
+
+
+def test_extraction_error_keeps_the_worker(sandbox):
+    first = worker_pid(sandbox)
+    with pytest.raises(ExtractionError):
+        sandbox.extract_text('/nonexistent/resume.docx', 'docx')
+    assert worker_pid(sandbox) == first
+    assert sandbox.stats()['failed'] == 1 and sandbox.stats()['recycled'] == 0
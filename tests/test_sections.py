@@ -0,0 +1,94 @@
+import pytest
+
+from app import ResumeParser
+
+
+@pytest.mark.parametrize('line, section', [
+    ('Experience', 'experience'),
+    ('PROFESSIONAL EXPERIENCE', 'experience'),
+    ('Research Experience', 'experience'),
+    ('Leadership Experience', 'experience'),
+    ('Experience Highlights', 'experience'),
+    ('Work Experience (2018-Present)', 'experience'),
+    ('Experience - 2015 to 2020', 'experience'),
+    ('Skills and Abilities', 'skills'),
+    ('Projects / Portfolio', 'projects'),
+    ('Education', 'education'),
+])
+def test_classify_header_accepts_headers(line, section):
+    assert ResumeParser.classify_header(line) == (section, '')
+
+
+def test_classify_header_returns_inline_content():
+    assert ResumeParser.classify_header('Skills: Python, Go') == ('skills', 'Python, Go')
+
+
+@pytest.mark.parametrize('line', [
+    'I have skills in Python',
+    'Managed the tools team',
+    'Built internal tools.',
+    '• Experience with Kubernetes',
+    'Senior Engineer at Acme Corporation',
+    'Experience 2015',
+    'Acme Technologies',
+    'Volunteer Coordinator, 2015 - 2019',
+    'Senior Engineer, 2019 - Present',
+    'Training Coordinator',
+    'Education Consultant',
+    'Employment Lawyer',
+    'Customer Experience',
+])
+def test_classify_header_rejects_body_lines(line):
+    assert ResumeParser.classify_header(line) is None
+
+
+def test_segment_sections_spans():
+    lines = ['Jane Doe', 'Summary', 'Builds things', 'Skills: Python', 'Go', 'Education', 'MIT']
+    assert ResumeParser.segment_sections(lines) == [
+        (None, 0, 1), ('summary', 2, 3), ('skills', 3, 5), ('education', 6, 7)]
+    assert lines[3] == 'Python'
+
+
+def test_segment_sections_without_headers_is_one_span():
+    assert ResumeParser.segment_sections(['Jane Doe', 'Engineer']) == [(None, 0, 2)]
+    assert ResumeParser.segment_sections([]) == [(None, 0, 0)]
+
+
+def test_segment_sections_with_precomputed_headers():
+    lines = ['Jane Doe', 'Experience', 'Engineer at Acme', 'Skills: Python', 'Go']
+    headers = {i: ResumeParser.classify_header(line) for i, line in enumerate(lines)}
+    headers = {i: header for i, header in headers.items() if header}
+    expected = ResumeParser.segment_sections(list(lines))
+    assert ResumeParser.segment_sections(lines, headers) == expected
+    # Lines the given headers do not mark stay in the current section
+    assert ResumeParser.segment_sections(['Jane Doe', 'Experience', 'x'], {}) == [(None, 0, 3)]
+
+
+def test_headers_with_extra_words_start_their_section():
+    text = '\n'.join([
+        'Jane Doe',
+        'jane@example.com',
+        '',
+        'Research Experience',
+        'Graduate Researcher at MIT Media Lab',
+        '',
+        'Work Experience (2018-Present)',
+        'Senior Engineer at Acme Corporation',
+        '',
+        'Skills and Abilities',
+        'Python, Go',
+    ])
+    data = ResumeParser().parse_resume_text(text)
+    titles = [entry['title'] for entry in data['experience']]
+    assert titles == ['Graduate Researcher at MIT Media Lab', 'Senior Engineer at Acme Corporation']
+    assert data['skills'] == ['Python', 'Go']
+
+
+def test_job_lines_under_experience_stay_there():
+    lines = ['Senior Engineer, 2019 - Present', 'Acme Technologies', 'Built the billing platform used by 2M customers',
+             'Volunteer Coordinator, 2015 - 2019', 'Training Coordinator', 'Education Consultant',
+             'Employment Lawyer', 'Customer Experience']
+    text = '\n'.join(['Jane Doe', 'jane@example.com', '', 'Experience', *lines, '', 'Skills', 'Python, Go'])
+    data = ResumeParser().parse_resume_text(text)
+    assert [entry['title'] for entry in data['experience']] == lines
+    assert data['skills'] == ['Python', 'Go']
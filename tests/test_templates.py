@@ -0,0 +1,34 @@
+import hashlib
+import json
+import os
+
+import pytest
+
+from app import SITE_TEMPLATES, WebsiteGenerator
+
+GOLDEN_RENDERS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmark_golden.json')
+with open(GOLDEN_RENDERS) as f:
+    GOLDEN = json.load(f)
+
+
+@pytest.mark.parametrize('template', list(SITE_TEMPLATES))
+@pytest.mark.parametrize('dataset', list(GOLDEN['resumes']))
+def test_render_matches_golden(dataset, template):
+    files = WebsiteGenerator().render(template, GOLDEN['resumes'][dataset], GOLDEN['year'])
+    for name, content in files.items():
+        # If a template change is intended, regenerate benchmark_golden.json from the new output
+        assert hashlib.sha256(content.encode('utf-8')).hexdigest() == GOLDEN['sha256'][f"{dataset}/{template}/{name}"], name
+
+
+@pytest.mark.parametrize('template', list(SITE_TEMPLATES))
+def test_resume_values_are_html_escaped(template):
+    hostile = dict(GOLDEN['resumes']['sparse'], name='<script>alert(1)</script>', skills=['R&D'])
+    page = WebsiteGenerator().render(template, hostile)['index.html']
+    assert '<script>alert' not in page and '&lt;script&gt;' in page
+
+
+@pytest.mark.parametrize('template', list(SITE_TEMPLATES))
+def test_unhashable_values_render_as_text(template):
+    data = dict(GOLDEN['resumes']['sparse'], skills=[['Go', '<b>']])
+    page = WebsiteGenerator().render(template, data)['index.html']
+    assert "[&#x27;Go&#x27;, &#x27;&lt;b&gt;&#x27;]" in page
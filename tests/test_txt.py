@@ -0,0 +1,58 @@
+import codecs
+
+import pytest
+
+import app
+from app import FileParser
+
+TEXT = "José García\nIngeniero de software — Zürich\n"
+
+
+@pytest.mark.parametrize('data, encoding', [
+    (TEXT.encode('utf-8'), 'utf-8'),
+    (codecs.BOM_UTF8 + TEXT.encode('utf-8'), 'utf-8-sig'),
+    (TEXT.encode('utf-16'), 'utf-16'),
+    (codecs.BOM_UTF16_BE + TEXT.encode('utf-16-be'), 'utf-16'),
+    (TEXT.encode('utf-32'), 'utf-32'),
+])
+def test_codec_is_chosen_from_bom_or_utf8(data, encoding):
+    stats = {}
+    assert FileParser.extract_text_from_txt(data, stats=stats) == TEXT
+    assert stats['encoding'] == encoding
+
+
+def test_non_utf8_text_falls_back_to_latin1():
+    data = "José García\nZürich\n".encode('latin-1')
+    stats = {}
+    assert FileParser.extract_text_from_txt(data, stats=stats) == "José García\nZürich\n"
+    assert stats['encoding'] == 'latin-1'
+
+
+def test_character_split_across_decode_chunks(monkeypatch):
+    monkeypatch.setattr(app, 'TXT_DECODE_CHUNK', 4)
+    assert FileParser.decode_text("aaé€b".encode('utf-8')) == ("aaé€b", 'utf-8')
+
+
+def test_large_file_is_memory_mapped(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, 'TXT_MMAP_THRESHOLD', 16)
+    path = tmp_path / 'resume.txt'
+    path.write_bytes(TEXT.encode('utf-8') * 4)
+    stats = {}
+    assert FileParser.extract_text_from_txt(str(path), stats=stats) == TEXT * 4
+    assert stats['encoding'] == 'utf-8'
+
+
+TRUNCATED_UTF16 = b'\xff\xfeJ\x00o'  # UTF-16 LE mark, then a truncated character
+
+
+@pytest.mark.parametrize('mapped', [False, True])
+def test_invalid_data_after_a_bom_falls_back_to_latin1(tmp_path, monkeypatch, mapped):
+    source = TRUNCATED_UTF16
+    if mapped:
+        monkeypatch.setattr(app, 'TXT_MMAP_THRESHOLD', 4)
+        path = tmp_path / 'resume.txt'
+        path.write_bytes(TRUNCATED_UTF16)
+        source = str(path)
+    stats = {}
+    assert FileParser.extract_text_from_txt(source, stats=stats) == TRUNCATED_UTF16.decode('latin-1')
+    assert stats['encoding'] == 'latin-1'
@@ -0,0 +1,70 @@
+import io
+import os
+import uuid
+
+import pytest
+
+import app
+
+RESUME = "Jane Doe\nSoftware Engineer\njane@example.com\n\nExperience\nEngineer at Acme\n\nSkills\nPython, Go\n"
+
+
+@pytest.fixture
+def client():
+    return app.app.test_client()
+
+
+@pytest.fixture
+def sources(monkeypatch):
+    """Record the source each upload is extracted from, and whether its file existed then"""
+    seen = []
+    extract_text = app.extraction_cache.extract_text
+
+    def spy(source, *args, **kwargs):
+        seen.append((source, isinstance(source, str) and os.path.isfile(source)))
+        return extract_text(source, *args, **kwargs)
+
+    monkeypatch.setattr(app.extraction_cache, 'extract_text', spy)
+    return seen
+
+
+def upload(client, text, name='resume.txt'):
+    data = {'file': (io.BytesIO(text.encode('utf-8')), name), 'template': 'modern'}
+    return client.post('/api/upload-resume', data=data, content_type='multipart/form-data').get_json()
+
+
+@pytest.mark.parametrize('padding', [0, 1024 * 1024])
+def test_upload_under_the_threshold_is_extracted_from_memory(client, sources, padding):
+    # Werkzeug alone would spool the 1MB upload to a temporary file
+    response = upload(client, RESUME + ' ' * padding + uuid.uuid4().hex)
+    assert response['success'], response
+    (source, _), = sources
+    assert isinstance(source, io.BytesIO)
+    assert response['resume_data']['name'] == 'Jane Doe'
+
+
+def test_large_upload_is_written_once_to_a_private_dir(client, sources, monkeypatch):
+    monkeypatch.setitem(app.app.config, 'UPLOAD_SPOOL_THRESHOLD', 1024)
+    monkeypatch.setattr(app.shutil, 'copyfileobj', None)  # the upload must not be copied again
+    response = upload(client, RESUME + 'Go\n' * 1000 + uuid.uuid4().hex)
+    assert response['success'], response
+    (source, existed), = sources
+    assert isinstance(source, str) and existed
+    assert os.path.basename(os.path.dirname(source)).startswith('upload-')
+    # The directory goes away with the request
+    assert not os.path.exists(os.path.dirname(source))
+
+
+def test_same_upload_again_is_served_from_the_extraction_cache(client):
+    text = RESUME + uuid.uuid4().hex
+    first = upload(client, text)
+    again = upload(client, text, name='renamed.txt')
+    assert first['extraction']['engine'] == 'text'
+    assert again['extraction']['engine'] == 'cache'
+    assert again['resume_data'] == first['resume_data']
+
+
+def test_rtf_saved_as_doc_is_refused_by_name(client):
+    data = {'file': (io.BytesIO(b'{\\rtf1\\ansi Jane Doe\\par}'), 'resume.doc')}
+    response = client.post('/api/upload-resume', data=data, content_type='multipart/form-data').get_json()
+    assert not response['success'] and 'RTF' in response['error']